@@ -0,0 +1,158 @@
+"""
+Micro-benchmarks for every Vector2 operation, plus the fixed-point types
+against Decimal.
+
+Run with `python -m zephyros1938.benchmarks`. Pass `--json PATH` to save the
+results so construction overhead can be compared between versions.
+"""
+
+import argparse
+import json
+import timeit
+
+from zephyros1938.csharp import *
+
+# (name, statement) pairs, timed against the globals set up in _SETUP.
+BENCHMARKS = [
+    ("Vector2(X, Y)", "Vector2(a, b)"),
+    ("Vector2(X)", "Vector2(a)"),
+    ("Vector2()", "Vector2()"),
+    ("Vector2._new", "Vector2._new(a, b)"),
+    ("Vector2.Zero", "Vector2.Zero"),
+    ("Vector2.UnitX", "Vector2.UnitX"),
+    ("Vector2.UnitY", "Vector2.UnitY"),
+    ("Vector2.One", "Vector2.One"),
+    ("Vector2.Pi", "Vector2.Pi"),
+    ("Vector2.Tau", "Vector2.Tau"),
+    ("Vector2.E", "Vector2.E"),
+    ("Vector2.Epsilon", "Vector2.Epsilon"),
+    ("v.Zero", "v.Zero"),
+    ("v + Vector2", "v + w"),
+    ("v + tuple", "v + t"),
+    ("v + float", "v + f"),
+    ("v + int", "v + i"),
+    ("v - Vector2", "v - w"),
+    ("v - tuple", "v - t"),
+    ("v - float", "v - f"),
+    ("v - int", "v - i"),
+    ("v * Vector2", "v * w"),
+    ("v * tuple", "v * t"),
+    ("v * float", "v * f"),
+    ("v * int", "v * i"),
+    ("v / Vector2", "v / w"),
+    ("v / tuple", "v / t"),
+    ("v / float", "v / f"),
+    ("v / int", "v / i"),
+    ("v[0]", "v[0]"),
+    ("v[1]", "v[1]"),
+    ("v[0] = f", "v[0] = f"),
+    ("v[1] = f", "v[1] = f"),
+    ("str(v)", "str(v)"),
+    ("v.XY", "v.XY"),
+    ("v.XX", "v.XX"),
+    ("v.YY", "v.YY"),
+    ("v.YX", "v.YX"),
+    ("Vector2.Abs", "Vector2.Abs(v)"),
+    ("Vector2.Abs tuple", "Vector2.Abs(t)"),
+    ("Vector2.Add", "Vector2.Add(v, w)"),
+    ("Vector2.Dot", "Vector2.Dot(v, w)"),
+    ("Vector2.ToVector2", "Vector2.ToVector2(v)"),
+    ("v.set", "o.set(a, b)"),
+    ("v.add_into", "v.add_into(w, o)"),
+    ("v.sub_into", "v.sub_into(w, o)"),
+    ("v.mul_into", "v.mul_into(w, o)"),
+    ("v.div_into", "v.div_into(w, o)"),
+    ("v.iadd", "o.iadd(w)"),
+    ("v.isub", "o.isub(w)"),
+    ("v.imul", "o.imul(u)"),
+    ("v.idiv", "o.idiv(u)"),
+    ("v.swizzle_into", "v.swizzle_into('YX', o)"),
+]
+
+# Scalar fixed-point against the Decimal it replaces.
+FIXED_BENCHMARKS = [
+    ("Decimal * Decimal", "d * d2"),
+    ("Q16_16 * Q16_16", "q * q2"),
+    ("Decimal + Decimal", "d + d2"),
+    ("Q16_16 + Q16_16", "q + q2"),
+    ("Decimal / Decimal", "d / d2"),
+    ("Q16_16 / Q16_16", "q / q2"),
+]
+
+# Batch operations over BATCH_SIZE elements, reported per element.
+BATCH_SIZE = 10000
+BATCH_BENCHMARKS = [
+    ("[Decimal] * scalar", "[v * d2 for v in ds]"),
+    ("FixedArray * scalar", "fa * 1.5"),
+    ("Q32_32 FixedArray * scalar", "fa64 * 1.5"),
+    ("[Decimal] + [Decimal]", "[v + u for v, u in zip(ds, ds)]"),
+    ("FixedArray + FixedArray", "fa + fa"),
+    ("[Decimal] - scalar", "[v - d2 for v in ds]"),
+    ("FixedArray - scalar", "fa - 1.5"),
+    ("[Decimal] * [Decimal]", "[v * u for v, u in zip(ds, ds)]"),
+    ("FixedArray * FixedArray", "fa * fa"),
+    ("[Decimal] / scalar", "[v / d2 for v in ds]"),
+    ("FixedArray / scalar", "fa / 1.5"),
+]
+
+_SETUP = {
+    "a": Single(1.5),
+    "b": Single(-2.25),
+    "f": 0.5,
+    "i": 3,
+    "t": (Single(2), Single(4)),
+}
+
+
+def _namespace():
+    ns = dict(globals())
+    ns.update(_SETUP)
+    ns["v"] = Vector2(Single(3), Single(-7))
+    ns["w"] = Vector2(Single(2), Single(5))
+    ns["o"] = Vector2(Single(1), Single(1))
+    # imul/idiv run repeatedly on o, so scale by one to keep it finite.
+    ns["u"] = Vector2(Single(1), Single(1))
+    ns["d"], ns["d2"] = Decimal("3.25"), Decimal("1.5")
+    ns["q"], ns["q2"] = Q16_16(3.25), Q16_16(1.5)
+    return ns
+
+
+def _batch_namespace():
+    ns = _namespace()
+    values = [i / 3 for i in range(BATCH_SIZE)]
+    ns["ds"] = [Decimal(str(v)) for v in values]
+    ns["fa"] = FixedArray(values)
+    ns["fa64"] = FixedArray(values, Q32_32)
+    return ns
+
+
+def Run(number=100000, repeat=5):
+    """
+    Returns {name: best nanoseconds per call} for every benchmark.
+    """
+    results = {}
+    for name, stmt in BENCHMARKS + FIXED_BENCHMARKS:
+        times = timeit.repeat(stmt, globals=_namespace(), number=number, repeat=repeat)
+        results[name] = min(times) / number * 1e9
+    batch_number = max(1, number // BATCH_SIZE)
+    batch_ns = _batch_namespace()
+    for name, stmt in BATCH_BENCHMARKS:
+        times = timeit.repeat(stmt, globals=batch_ns, number=batch_number, repeat=repeat)
+        results[f"{name} (per element)"] = min(times) / (batch_number * BATCH_SIZE) * 1e9
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", "--number", type=int, default=100000)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("--json", metavar="PATH", help="also write results as JSON")
+    args = parser.parse_args()
+
+    results = Run(args.number, args.repeat)
+    width = max(len(name) for name in results)
+    for name, ns in results.items():
+        print(f"{name.ljust(width)} : {ns:10.1f} ns")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
@@ -1,5 +1,11 @@
+import array
 import datetime
 import decimal
+import fractions
+import functools
+import operator
+import sys
+import threading
 import uuid
 import struct
 
@@ -40,6 +46,63 @@ def _check_int_range(value, bits, signed=True):
     return value
 
 
+_SINGLE = struct.Struct("f")
+
+
+def _round_single(value):
+    """
+    Round a float to 32-bit precision without creating a Single.
+    """
+    return _SINGLE.unpack(_SINGLE.pack(value))[0]
+
+
+# Open AllocationCounters per thread ident. Empty unless a counter is open,
+# so the hot paths only pay for a truth test.
+_ACTIVE_COUNTERS = {}
+
+
+def _count_allocation(kind):
+    for counter in _ACTIVE_COUNTERS.get(threading.get_ident(), ()):
+        counter.counts[kind] += 1
+
+
+class AllocationCounter:
+    """
+    Context manager reporting how many Vector2 and CSharpFloat objects the
+    current thread constructed inside its with block. Other threads'
+    allocations are not counted, and nothing is counted while no counter is
+    open.
+    """
+
+    def __init__(self):
+        self.counts = {"Vector2": 0, "CSharpFloat": 0}
+
+    def __enter__(self):
+        self.counts = {"Vector2": 0, "CSharpFloat": 0}
+        _ACTIVE_COUNTERS.setdefault(threading.get_ident(), []).append(self)
+        return self
+
+    def __exit__(self, *exc):
+        ident = threading.get_ident()
+        counters = _ACTIVE_COUNTERS[ident]
+        counters.remove(self)
+        if not counters:
+            del _ACTIVE_COUNTERS[ident]
+        return False
+
+    @property
+    def Vector2(self):
+        return self.counts["Vector2"]
+
+    @property
+    def CSharpFloat(self):
+        return self.counts["CSharpFloat"]
+
+    @property
+    def total(self):
+        return self.Vector2 + self.CSharpFloat
+
+
 class AutoCastDescriptor:
     def __init__(self, typ, default):
         self.typ = typ
@@ -187,11 +250,12 @@ class CSharpFloat(float):
     _precision = "64"  # Use '32' for Single; '64' for Double
 
     def __new__(cls, value):
+        if _ACTIVE_COUNTERS:
+            _count_allocation("CSharpFloat")
         value = float(value)
         if cls._precision == "32":
             # Simulate conversion to a 32-bit float.
-            packed = struct.pack("f", value)
-            value = struct.unpack("f", packed)[0]
+            value = _round_single(value)
         return super().__new__(cls, value)
 
     def __add__(self, other):
@@ -246,11 +310,315 @@ class Decimal(decimal.Decimal):
         return super().__new__(cls, value, *args, **kwargs)
 
 
+# --- Fixed-Point Types ---
+
+
+def _fixed_div(a, b, frac):
+    """
+    Divide two raw fixed-point values, truncating toward zero like C# integer division.
+    """
+    if b == 0:
+        raise ZeroDivisionError("Fixed-point division by zero")
+    q = (abs(a) << frac) // abs(b)
+    return -q if (a < 0) != (b < 0) else q
+
+
+def _promote_op(a, b, op):
+    """
+    Apply op to two fixed-point values of different types, after converting
+    both to the wider of the two (the conversion is exact).
+    """
+    wide = max(a.__class__, b.__class__, key=lambda t: (t._bits, t._frac))
+    return op(wide(a), wide(b))
+
+
+class CSharpFixed(object):
+    """
+    Base class for signed binary fixed-point types. The value is held as a raw
+    integer of the underlying CSharpInt type scaled by 2**_frac and wraps on
+    overflow like unchecked C# arithmetic, so results are bit-identical on
+    every machine. Mixing two fixed-point types promotes to the wider one.
+
+    Performance: this buys determinism, not speed. Each scalar operation is
+    a pure-Python call and costs roughly 5-8x a C-backed decimal operation
+    (see `python -m zephyros1938.benchmarks`). For many entities, use
+    FixedArray.
+    """
+
+    __slots__ = ("raw",)
+
+    _raw_type = Int32  # Override in subclasses.
+    _frac = 16  # Number of fractional bits; override in subclasses.
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._bits = cls._raw_type._bits
+        cls._one = 1 << cls._frac
+        cls._half_range = 1 << (cls._bits - 1)
+        cls._mask = (1 << cls._bits) - 1
+        cls._typecode = "i" if cls._bits == 32 else "q"
+
+    def __new__(cls, value=0):
+        if isinstance(value, CSharpFixed):
+            shift = cls._frac - value._frac
+            raw = value.raw << shift if shift >= 0 else value.raw >> -shift
+        elif isinstance(value, decimal.Decimal):
+            raw = int((value * cls._one).to_integral_value(decimal.ROUND_HALF_EVEN))
+        elif isinstance(value, int):
+            raw = int(value) << cls._frac
+        else:
+            raw = round(float(value) * cls._one)
+        self = object.__new__(cls)
+        self.raw = _check_int_range(raw, cls._bits, True)
+        return self
+
+    @classmethod
+    def FromRaw(cls, raw):
+        """
+        Build a value directly from its raw scaled integer, wrapping on overflow.
+        """
+        self = object.__new__(cls)
+        half = cls._half_range
+        self.raw = ((raw + half) & cls._mask) - half
+        return self
+
+    def _other_raw(self, other):
+        if other.__class__ is self.__class__:
+            return other.raw
+        return self.__class__(other).raw
+
+    # The operators below inline FromRaw and _other_raw; they are the hot path.
+
+    def __add__(self, other):
+        cls = self.__class__
+        if other.__class__ is not cls:
+            if isinstance(other, CSharpFixed):
+                return _promote_op(self, other, operator.add)
+            other = cls(other)
+        half = cls._half_range
+        r = object.__new__(cls)
+        r.raw = ((self.raw + other.raw + half) & cls._mask) - half
+        return r
+
+    def __sub__(self, other):
+        cls = self.__class__
+        if other.__class__ is not cls:
+            if isinstance(other, CSharpFixed):
+                return _promote_op(self, other, operator.sub)
+            other = cls(other)
+        half = cls._half_range
+        r = object.__new__(cls)
+        r.raw = ((self.raw - other.raw + half) & cls._mask) - half
+        return r
+
+    def __mul__(self, other):
+        cls = self.__class__
+        if other.__class__ is not cls:
+            if isinstance(other, CSharpFixed):
+                return _promote_op(self, other, operator.mul)
+            other = cls(other)
+        half = cls._half_range
+        r = object.__new__(cls)
+        r.raw = (((self.raw * other.raw) >> cls._frac) + half & cls._mask) - half
+        return r
+
+    def __truediv__(self, other):
+        cls = self.__class__
+        if other.__class__ is not cls:
+            if isinstance(other, CSharpFixed):
+                return _promote_op(self, other, operator.truediv)
+            other = cls(other)
+        # Inlined _fixed_div: truncate toward zero, flooring on magnitudes.
+        a, b, frac, half = self.raw, other.raw, cls._frac, cls._half_range
+        q = (a << frac) // b if (a ^ b) >= 0 else -((-a << frac) // b)
+        r = object.__new__(cls)
+        r.raw = ((q + half) & cls._mask) - half
+        return r
+
+    def __floordiv__(self, other):
+        cls = self.__class__
+        if other.__class__ is not cls:
+            if isinstance(other, CSharpFixed):
+                return _promote_op(self, other, operator.floordiv)
+            other = cls(other)
+        return self.FromRaw((self.raw // other.raw) << cls._frac)
+
+    def __mod__(self, other):
+        # Both raws share one scale, so the remainder needs no rescaling.
+        cls = self.__class__
+        if other.__class__ is not cls:
+            if isinstance(other, CSharpFixed):
+                return _promote_op(self, other, operator.mod)
+            other = cls(other)
+        return self.FromRaw(self.raw % other.raw)
+
+    def __divmod__(self, other):
+        return self // other, self % other
+
+    def __radd__(self, other):
+        return self.FromRaw(self._other_raw(other) + self.raw)
+
+    def __rsub__(self, other):
+        return self.FromRaw(self._other_raw(other) - self.raw)
+
+    def __rmul__(self, other):
+        return self.FromRaw((self._other_raw(other) * self.raw) >> self._frac)
+
+    def __rtruediv__(self, other):
+        return self.FromRaw(_fixed_div(self._other_raw(other), self.raw, self._frac))
+
+    def __rfloordiv__(self, other):
+        return self.FromRaw((self._other_raw(other) // self.raw) << self._frac)
+
+    def __rmod__(self, other):
+        return self.FromRaw(self._other_raw(other) % self.raw)
+
+    def __rdivmod__(self, other):
+        return other // self, other % self
+
+    def __pow__(self, exponent):
+        """
+        Integer powers only, by square-and-multiply in fixed point, so the
+        result is as deterministic as the multiplications it is built from.
+        """
+        if not isinstance(exponent, int):
+            return NotImplemented
+        one = self.FromRaw(self._one)
+        if exponent < 0:
+            return one / (self ** -exponent)
+        result, base = one, self
+        while exponent:
+            if exponent & 1:
+                result = result * base
+            exponent >>= 1
+            if exponent:
+                base = base * base
+        return result
+
+    def __neg__(self):
+        return self.FromRaw(-self.raw)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return self.FromRaw(abs(self.raw))
+
+    def _as_fraction(self):
+        return fractions.Fraction(self.raw, self._one)
+
+    def _exact(self, other):
+        """
+        The exact value to compare other against, or None if other is not a
+        number this type compares with.
+        """
+        if isinstance(other, CSharpFixed):
+            return other._as_fraction()
+        if isinstance(other, (int, float, decimal.Decimal, fractions.Fraction)):
+            return other
+        return None
+
+    # Comparisons are exact, never rounding the other operand into fixed
+    # point, so they agree with each other and with __hash__.
+
+    def __eq__(self, other):
+        if other.__class__ is self.__class__:
+            return self.raw == other.raw
+        o = self._exact(other)
+        if o is None:
+            return NotImplemented
+        return self._as_fraction() == o
+
+    def __lt__(self, other):
+        if other.__class__ is self.__class__:
+            return self.raw < other.raw
+        o = self._exact(other)
+        if o is None:
+            return NotImplemented
+        return self._as_fraction() < o
+
+    def __le__(self, other):
+        if other.__class__ is self.__class__:
+            return self.raw <= other.raw
+        o = self._exact(other)
+        if o is None:
+            return NotImplemented
+        return self._as_fraction() <= o
+
+    def __gt__(self, other):
+        if other.__class__ is self.__class__:
+            return self.raw > other.raw
+        o = self._exact(other)
+        if o is None:
+            return NotImplemented
+        return self._as_fraction() > o
+
+    def __ge__(self, other):
+        if other.__class__ is self.__class__:
+            return self.raw >= other.raw
+        o = self._exact(other)
+        if o is None:
+            return NotImplemented
+        return self._as_fraction() >= o
+
+    def __hash__(self):
+        # Hash like the int/float/Fraction of the same value.
+        if self.raw & (self._one - 1) == 0:
+            return hash(self.raw >> self._frac)
+        return hash(self._as_fraction())
+
+    def __bool__(self):
+        return self.raw != 0
+
+    def __float__(self):
+        return self.raw / self._one
+
+    def __int__(self):
+        # Truncate toward zero, as a C# cast would.
+        return -(-self.raw >> self._frac) if self.raw < 0 else self.raw >> self._frac
+
+    def __str__(self):
+        return str(float(self))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({float(self)!r})"
+
+    def ToSingle(self):
+        return Single(self.raw / self._one)
+
+    def ToDouble(self):
+        return Double(self.raw / self._one)
+
+    def ToDecimal(self):
+        # raw / 2**frac always terminates in decimal, within raw digits plus
+        # frac digits of 5**frac; give the division enough precision to be exact.
+        with decimal.localcontext() as ctx:
+            ctx.prec = len(str(abs(self.raw))) + self._frac + 1
+            return Decimal(decimal.Decimal(self.raw) / self._one)
+
+
+class Q16_16(CSharpFixed):
+    __slots__ = ()
+    _raw_type = Int32
+    _frac = 16
+
+
+class Q32_32(CSharpFixed):
+    __slots__ = ()
+    _raw_type = Int64
+    _frac = 32
+
+
+for _fixed_type in (Q16_16, Q32_32):
+    _fixed_type.MAX_VALUE = _fixed_type.FromRaw(_fixed_type._raw_type.MAX_VALUE)
+    _fixed_type.MIN_VALUE = _fixed_type.FromRaw(_fixed_type._raw_type.MIN_VALUE)
+    _fixed_type.Epsilon = _fixed_type.FromRaw(1)
+del _fixed_type
+
+
 def IsNumeric(V):
-    return (
-        isinstance(V, CSharpInt) or isinstance(V, CSharpFloat),
-        isinstance(V, int) or isinstance(V, float),
-    )
+    # CSharpInt and CSharpFloat subclass int and float, so this covers them too.
+    return isinstance(V, (int, float))
 
 
 # --- Reference Types ---
@@ -385,72 +753,107 @@ class Map(dict):
         return super().__new__(cls, *args, **kwargs)
 
 
+def _vector2_components(v):
+    """
+    Split a Vector2, tuple or scalar into its two components without
+    building a temporary Vector2.
+    """
+    if isinstance(v, Vector2):
+        return v.X, v.Y
+    if isinstance(v, tuple):
+        return v[0], v[1]
+    if isinstance(v, (int, float)):
+        return v, v
+    raise ArithmeticError(f"Could not use {v} as a Vector2")
+
+
+_SINGLE_ZERO = Single(0)
+_SINGLE_ONE = Single(1)
+
+
+class _Vector2Constant:
+    """
+    Serves a Vector2 constant, on the class and on instances, as a fresh
+    vector each time, so in-place operations on one cannot corrupt the
+    constant for everyone else.
+    """
+
+    def __init__(self, X, Y):
+        self.X = X
+        self.Y = Y
+
+    def __get__(self, instance, owner):
+        return owner._new(self.X, self.Y)
+
+
 class Vector2(metaclass=AutoCastMeta):
     def __init__(self, X=None, Y=None):
-        if X != None and Y != None:
-            if not (IsNumeric(X) and IsNumeric(Y)):
-                raise ValueError(
-                    "X and Y value of Vector2 must be of CSharpFloat type."
-                )
-            self.X = X or CSharpFloat(0)
-            self.Y = Y or CSharpFloat(0)
-        elif X != None and Y == None:
-            if not (IsNumeric(X)):
-                raise ValueError("X value of Vector2 must be of CSharpFloat type.")
-            self.X = X or CSharpFloat(0)
-            self.Y = X or CSharpFloat(0)
-        elif X == None and Y != None:
-            if not (IsNumeric(Y)):
-                raise ValueError("Y value of Vector2 must be of CSharpFloat type.")
-            self.X = Y or CSharpFloat(0)
-            self.Y = Y or CSharpFloat(0)
-        else:
+        """
+        Validating constructor for user input. A single component is used for
+        both axes. Internal code that already holds numbers uses Vector2._new.
+        """
+        if _ACTIVE_COUNTERS:
+            _count_allocation("Vector2")
+        if X is None:
+            X = Y
+        elif Y is None:
+            Y = X
+        if X is None:
             self.X = CSharpFloat(0)
             self.Y = CSharpFloat(0)
+            return
+        if not (IsNumeric(X) and IsNumeric(Y)):
+            raise ValueError(
+                f"X and Y value of Vector2 must be numeric, got {type(X).__name__} and {type(Y).__name__}"
+            )
+        self.X = X or CSharpFloat(0)
+        self.Y = Y or CSharpFloat(0)
+
+    @classmethod
+    def _new(cls, X, Y):
+        """
+        Trusted constructor: skips validation and __init__. Callers guarantee
+        X and Y are numbers.
+        """
+        if _ACTIVE_COUNTERS:
+            _count_allocation("Vector2")
+        v = object.__new__(cls)
+        v.X = X
+        v.Y = Y
+        return v
+
+    def _operand(self, other, verb):
+        """
+        Components of the right-hand operand, with scalars and tuples rounded
+        to Single the way the operators always have.
+        """
+        if isinstance(other, Vector2):
+            return other.X, other.Y
+        if isinstance(other, (int, float)):
+            s = _round_single(float(other))
+            return s, s
+        if isinstance(other, tuple):
+            return _round_single(float(other[0])), _round_single(float(other[1]))
+        raise ArithmeticError(f"Could not {verb} {self} by {other}")
+
+    # Results are always rounded to Single, whatever the component types
+    # (the in-place variants below store plain 32-bit-rounded floats).
 
     def __add__(self, other):
-        if isinstance(other, __class__):
-            return self.__class__(self.X + other.X, self.Y + other.Y)
-        if isinstance(other, float):
-            return self.__class__(self.X + Single(other), self.Y + Single(other))
-        if isinstance(other, int):
-            return self.__class__(self.X + Single(other), self.Y + Single(other))
-        if isinstance(other, tuple):
-            return self.__class__(self.X + Single(other[0]), self.Y + Single(other[1]))
-        raise ArithmeticError(f"Could not add {self} by {other}")
+        ox, oy = self._operand(other, "add")
+        return self._new(Single(float(self.X) + ox), Single(float(self.Y) + oy))
 
     def __sub__(self, other):
-        if isinstance(other, __class__):
-            return self.__class__(self.X - other.X, self.Y - other.Y)
-        if isinstance(other, float):
-            return self.__class__(self.X - Single(other), self.Y - Single(other))
-        if isinstance(other, int):
-            return self.__class__(self.X - Single(other), self.Y - Single(other))
-        if isinstance(other, tuple):
-            return self.__class__(self.X - Single(other[0]), self.Y - Single(other[1]))
-        raise ArithmeticError(f"Could not subtract {self} by {other}")
+        ox, oy = self._operand(other, "subtract")
+        return self._new(Single(float(self.X) - ox), Single(float(self.Y) - oy))
 
     def __mul__(self, other):
-        if isinstance(other, __class__):
-            return self.__class__(self.X * other.X, self.Y * other.Y)
-        if isinstance(other, float):
-            return self.__class__(self.X * Single(other), self.Y * Single(other))
-        if isinstance(other, int):
-            return self.__class__(self.X * Single(other), self.Y * Single(other))
-        if isinstance(other, tuple):
-            return self.__class__(self.X * Single(other[0]), self.Y * Single(other[1]))
-        raise ArithmeticError(f"Could not multiply {self} by {other}")
+        ox, oy = self._operand(other, "multiply")
+        return self._new(Single(float(self.X) * ox), Single(float(self.Y) * oy))
 
     def __truediv__(self, other):
-        if isinstance(other, __class__):
-            return self.__class__(self.X / other.X, self.Y / other.Y)
-        if isinstance(other, float):
-            return self.__class__(self.X / Single(other), self.Y / Single(other))
-        if isinstance(other, int):
-            return self.__class__(self.X / Single(other), self.Y / Single(other))
-        if isinstance(other, tuple):
-            return self.__class__(self.X / Single(other[0]), self.Y / Single(other[1]))
-        raise ArithmeticError(f"Could not divide {self} by {other}")
+        ox, oy = self._operand(other, "divide")
+        return self._new(Single(float(self.X) / ox), Single(float(self.Y) / oy))
 
     def __str__(self):
         return f"({Single(self.X)}, {Single(self.Y)})"
@@ -474,65 +877,460 @@ class Vector2(metaclass=AutoCastMeta):
     @staticmethod
     def Abs(v):
         if isinstance(v, Vector2):
-            return Vector2(Single.Abs(v.X), Single.Abs(v.Y))
+            return Vector2._new(Single.Abs(v.X), Single.Abs(v.Y))
         if isinstance(v, tuple):
             if len(v) != 2:
                 raise ValueError(
                     f"Tuple length for Vector2.Abs must be 2, got {len(v)}"
                 )
-            return Vector2(Single.Abs(tuple[0]), Single.Abs(tuple[1]))
+            return Vector2._new(Single.Abs(v[0]), Single.Abs(v[1]))
         if isinstance(v, float):
             vabs: Single = Single.Abs(v)
-            return Vector2(vabs, vabs)
+            return Vector2._new(vabs, vabs)
         raise ArithmeticError(f"Could not get absolute value of {v}")
 
     @staticmethod
     def Add(left, right):
-        [l, r] = [__class__.ToVector2(left), __class__.ToVector2(right)]
-        return l + r
+        lx, ly = _vector2_components(left)
+        rx, ry = _vector2_components(right)
+        return Vector2._new(Single(float(lx) + float(rx)), Single(float(ly) + float(ry)))
 
     @staticmethod
     def Dot(left, right) -> Single:
-        [l, r] = [__class__.ToVector2(left), __class__.ToVector2(right)]
-        return (l.X * r.X) + (l.Y * r.Y)
+        lx, ly = _vector2_components(left)
+        rx, ry = _vector2_components(right)
+        # Round each product, then the sum, to Single exactly as Single
+        # components would, whatever types the components are stored as.
+        return Single(
+            _round_single(float(lx) * float(rx)) + _round_single(float(ly) * float(ry))
+        )
+
+    # --- In-place variants ---
+    # These write plain 32-bit-rounded floats into an existing Vector2 and
+    # allocate no Vector2 or CSharpFloat objects.
+
+    def set(self, X, Y):
+        self.X = _round_single(float(X))
+        self.Y = _round_single(float(Y))
+        return self
+
+    def add_into(self, other, out):
+        ox, oy = self._operand(other, "add")
+        out.X = _round_single(float(self.X) + ox)
+        out.Y = _round_single(float(self.Y) + oy)
+        return out
+
+    def sub_into(self, other, out):
+        ox, oy = self._operand(other, "subtract")
+        out.X = _round_single(float(self.X) - ox)
+        out.Y = _round_single(float(self.Y) - oy)
+        return out
+
+    def mul_into(self, other, out):
+        ox, oy = self._operand(other, "multiply")
+        out.X = _round_single(float(self.X) * ox)
+        out.Y = _round_single(float(self.Y) * oy)
+        return out
+
+    def div_into(self, other, out):
+        ox, oy = self._operand(other, "divide")
+        out.X = _round_single(float(self.X) / ox)
+        out.Y = _round_single(float(self.Y) / oy)
+        return out
+
+    def iadd(self, other):
+        return self.add_into(other, self)
+
+    def isub(self, other):
+        return self.sub_into(other, self)
+
+    def imul(self, other):
+        return self.mul_into(other, self)
+
+    def idiv(self, other):
+        return self.div_into(other, self)
+
+    def swizzle_into(self, pattern: str, out):
+        """
+        Write a swizzle such as "YX" into out instead of allocating a new Vector2.
+        """
+        x, y = float(self.X), float(self.Y)
+        out.X = x if pattern[0] == "X" else y
+        out.Y = x if pattern[1] == "X" else y
+        return out
 
     @staticmethod
     def ToVector2(v):
         if isinstance(v, Vector2):
-            return Vector2(v.X, v.Y)
+            return Vector2._new(v.X, v.Y)
         if isinstance(v, tuple):
-            return Vector2(v[0], v[1])
+            return Vector2._new(v[0], v[1])
         if isinstance(v, float):
-            return Vector2(v, v)
+            return Vector2._new(v, v)
         raise ValueError(
             f"Could not convert {v} with type {type(v).__name__} to Vector2"
         )
 
     @property
     def XY(self):
-        return self.__class__(Single(self.X), Single(self.Y))
+        return self._new(Single(self.X), Single(self.Y))
 
     @property
     def XX(self):
-        return self.__class__(Single(self.X), Single(self.X))
+        return self._new(Single(self.X), Single(self.X))
 
     @property
     def YY(self):
-        return self.__class__(Single(self.Y), Single(self.Y))
+        return self._new(Single(self.Y), Single(self.Y))
 
     @property
     def YX(self):
-        return self.__class__(Single(self.Y), Single(self.X))
+        return self._new(Single(self.Y), Single(self.X))
+
+    Pi = _Vector2Constant(Single.Pi, Single.Pi)
+    Tau = _Vector2Constant(Single.Tau, Single.Tau)
+    E = _Vector2Constant(Single.E, Single.E)
+    Epsilon = _Vector2Constant(Single.Epsilon, Single.Epsilon)
+    UnitX = _Vector2Constant(_SINGLE_ONE, _SINGLE_ZERO)
+    UnitY = _Vector2Constant(_SINGLE_ZERO, _SINGLE_ONE)
+    Zero = _Vector2Constant(_SINGLE_ZERO, _SINGLE_ZERO)
+    One = _Vector2Constant(_SINGLE_ONE, _SINGLE_ONE)
+
+
+class Vector2Pool:
+    """
+    Scoped pool of temporary Vector2s. Vectors handed out by get() go back
+    to a shared freelist when the with block exits, so a hot loop that uses
+    a pool per iteration stops allocating once the freelist is warm.
+    """
+
+    _freelist = []
 
-    Pi = (Single.Pi, Single.Pi)
-    Tau = (Single.Tau, Single.Tau)
-    E = (Single.E, Single.E)
-    Epsilon = (Single.Epsilon, Single.Epsilon)
-    UnitX = (Single(1), Single(0))
-    UnitY = (Single(0), Single(1))
-    Zero = (Single(0), Single(0))
-    One = (Single(1), Single(1))
+    def __init__(self):
+        self._taken = []
 
+    def get(self, X=0.0, Y=0.0) -> Vector2:
+        v = self._freelist.pop() if self._freelist else Vector2._new(0.0, 0.0)
+        v.set(X, Y)
+        self._taken.append(v)
+        return v
+
+    def release(self):
+        self._freelist.extend(self._taken)
+        self._taken.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+        return False
+
+
+class FixedVector2(object):
+    """
+    Deterministic counterpart of Vector2 with fixed-point components.
+    """
+
+    __slots__ = ("X", "Y")
+
+    _fixed = Q16_16  # Component type; override in subclasses.
+
+    def __init__(self, X=None, Y=None):
+        if X is None:
+            X = Y if Y is not None else 0
+        if Y is None:
+            Y = X
+        fixed = self._fixed
+        self.X = X if X.__class__ is fixed else fixed(X)
+        self.Y = Y if Y.__class__ is fixed else fixed(Y)
+
+    @classmethod
+    def _new(cls, x, y):
+        v = object.__new__(cls)
+        v.X = x
+        v.Y = y
+        return v
+
+    def _split(self, other):
+        if isinstance(other, FixedVector2):
+            return other.X, other.Y
+        if isinstance(other, (tuple, Vector2)):
+            return self._fixed(other[0]), self._fixed(other[1])
+        if isinstance(other, (int, float, decimal.Decimal, CSharpFixed)):
+            s = self._fixed(other)
+            return s, s
+        raise ArithmeticError(f"Could not combine {self} with {other}")
+
+    def __add__(self, other):
+        x, y = self._split(other)
+        return self._new(self.X + x, self.Y + y)
+
+    def __sub__(self, other):
+        x, y = self._split(other)
+        return self._new(self.X - x, self.Y - y)
+
+    def __mul__(self, other):
+        x, y = self._split(other)
+        return self._new(self.X * x, self.Y * y)
+
+    def __truediv__(self, other):
+        x, y = self._split(other)
+        return self._new(self.X / x, self.Y / y)
+
+    def __neg__(self):
+        return self._new(-self.X, -self.Y)
+
+    def __eq__(self, other):
+        if isinstance(other, FixedVector2):
+            return self.X == other.X and self.Y == other.Y
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.X, self.Y))
+
+    def __str__(self):
+        return f"({self.X}, {self.Y})"
+
+    def __getitem__(self, index: int):
+        if index == 0:
+            return self.X
+        if index == 1:
+            return self.Y
+        raise IndexError(f"Index must be within 0 or 1, got {index}")
+
+    @staticmethod
+    def Dot(left, right):
+        return (left.X * right.X) + (left.Y * right.Y)
+
+    @classmethod
+    def FromVector2(cls, v):
+        return cls(v.X, v.Y)
+
+    def ToVector2(self) -> Vector2:
+        return Vector2._new(self.X.ToSingle(), self.Y.ToSingle())
+
+
+# --- Packed-Lane Helpers ---
+# FixedArray packs its whole raw array into one Python int, one fixed-width
+# lane per element in native byte order, so add/sub/scalar-multiply run as a
+# handful of big-int operations in C instead of a Python loop per element.
+
+_LANE_FORMAT = {4: "I", 8: "Q"}
+_LOW_HALF = 0 if sys.byteorder == "little" else 1
+
+
+@functools.lru_cache(maxsize=16)
+def _lane_ones(count, size):
+    """
+    A packed int with each of count lanes of size bytes set to 1. Multiplying
+    it by a lane-sized constant repeats that constant across every lane.
+    """
+    return int.from_bytes((1).to_bytes(size, sys.byteorder) * count, sys.byteorder)
+
+
+def _lanes_to_int(raw):
+    return int.from_bytes(raw, sys.byteorder)
+
+
+def _int_to_lanes(value, typecode, count, size):
+    out = array.array(typecode)
+    out.frombytes(value.to_bytes(count * size, sys.byteorder))
+    return out
+
+
+def _widen_lanes(raw):
+    """
+    Pack raw with every lane zero-extended to twice its width.
+    """
+    fmt = _LANE_FORMAT[raw.itemsize]
+    out = bytearray(len(raw) * raw.itemsize * 2)
+    memoryview(out).cast(fmt)[_LOW_HALF::2] = memoryview(raw).cast("B").cast(fmt)
+    return int.from_bytes(out, sys.byteorder)
+
+
+def _narrow_lanes(value, typecode, count, size):
+    """
+    Unpack the low half of every double-width lane into a raw array.
+    """
+    wide = value.to_bytes(count * size * 2, sys.byteorder)
+    out = array.array(typecode)
+    out.frombytes(memoryview(wide).cast(_LANE_FORMAT[size])[_LOW_HALF::2].tobytes())
+    return out
+
+
+def _swar_add(x, y, high, low):
+    # Add the low bits of each lane, then fix up the top bit, so no carry
+    # ever crosses into the neighbouring lane.
+    return ((x & low) + (y & low)) ^ ((x ^ y) & high)
+
+
+def _swar_sub(x, y, high, low):
+    return ((x | high) - (y & low)) ^ ((x ^ y ^ high ^ low) & high)
+
+
+class FixedArray(object):
+    """
+    Batch of fixed-point values stored as raw integers in an array.array.
+    Add, subtract and multiply-by-scalar work on all lanes at once as packed
+    big integers and wrap exactly like CSharpFixed; element-wise multiply and
+    division fall back to a loop over the raw integers.
+
+    Performance against a list of Decimal, per element (see
+    `python -m zephyros1938.benchmarks`):
+    - add and subtract: about 4x faster;
+    - Q16_16 multiply by a scalar: about the same;
+    - Q32_32 multiply by a scalar: about the same to 1.5x slower;
+    - element-wise multiply and any division: about 1.3-2x slower.
+    """
+
+    __slots__ = ("_fixed", "raw")
+
+    def __init__(self, values=(), fixed=Q16_16):
+        self._fixed = fixed
+        self.raw = array.array(fixed._typecode, [fixed(v).raw for v in values])
+
+    @classmethod
+    def FromRaw(cls, raw, fixed=Q16_16):
+        half, mask = fixed._half_range, fixed._mask
+        return cls._wrap(
+            fixed, array.array(fixed._typecode, [((r + half) & mask) - half for r in raw])
+        )
+
+    @classmethod
+    def _wrap(cls, fixed, raw):
+        out = object.__new__(cls)
+        out._fixed = fixed
+        out.raw = raw
+        return out
+
+    def _lanes(self):
+        count, size = len(self.raw), self.raw.itemsize
+        ones = _lane_ones(count, size)
+        high = ones * self._fixed._half_range
+        return count, size, ones, high, high - ones
+
+    def _other_raw(self, other):
+        if isinstance(other, FixedArray):
+            if other._fixed is not self._fixed:
+                raise TypeError(
+                    f"Cannot combine {self._fixed.__name__} and {other._fixed.__name__} arrays"
+                )
+            if len(other.raw) != len(self.raw):
+                raise ValueError(
+                    f"FixedArray lengths differ: {len(self.raw)} and {len(other.raw)}"
+                )
+            return other.raw
+        return None
+
+    def _other_packed(self, other, ones):
+        o = self._other_raw(other)
+        if o is not None:
+            return _lanes_to_int(o)
+        return ones * (self._fixed(other).raw & self._fixed._mask)
+
+    def __add__(self, other):
+        count, size, ones, high, low = self._lanes()
+        packed = _swar_add(
+            _lanes_to_int(self.raw), self._other_packed(other, ones), high, low
+        )
+        return self._wrap(self._fixed, _int_to_lanes(packed, self.raw.typecode, count, size))
+
+    def __sub__(self, other):
+        count, size, ones, high, low = self._lanes()
+        packed = _swar_sub(
+            _lanes_to_int(self.raw), self._other_packed(other, ones), high, low
+        )
+        return self._wrap(self._fixed, _int_to_lanes(packed, self.raw.typecode, count, size))
+
+    def __mul__(self, other):
+        fixed = self._fixed
+        frac, half, mask = fixed._frac, fixed._half_range, fixed._mask
+        o = self._other_raw(other)
+        if o is not None:
+            return self._wrap(
+                fixed, self._wrap_wide([(a * b) >> frac for a, b in zip(self.raw, o)])
+            )
+        return self._wrap(fixed, self._scale(fixed(other).raw))
+
+    def _wrap_wide(self, values):
+        """
+        Wrap unbounded per-element results back into a raw array. For 32-bit
+        lanes the results fit in 64 bits, so they go through a 64-bit array
+        and the low halves are taken in C; wider lanes wrap per element.
+        """
+        fixed = self._fixed
+        if fixed._bits == 32:
+            wide = array.array("q", values)
+            out = array.array(fixed._typecode)
+            out.frombytes(
+                memoryview(wide).cast("B").cast("I")[_LOW_HALF::2].tobytes()
+            )
+            return out
+        half, mask = fixed._half_range, fixed._mask
+        return array.array(fixed._typecode, [((v + half) & mask) - half for v in values])
+
+    def _scale(self, s):
+        """
+        Multiply every lane by the raw scalar s, matching (a * s) >> frac
+        wrapped per element. Lanes are offset to unsigned (flipping the sign
+        bit adds half the range) and widened to twice their width, so one
+        big-int multiply cannot carry between lanes; the offset is removed
+        again in the wide lanes before narrowing back.
+        """
+        count, size = len(self.raw), self.raw.itemsize
+        fixed = self._fixed
+        frac, mask = fixed._frac, fixed._mask
+        wide_ones = _lane_ones(count, size * 2)
+        m = -s if s < 0 else s
+        offset = (m << (size * 8 - 1 - frac)) & mask
+        product = (_widen_lanes(self.raw) ^ (wide_ones * fixed._half_range)) * m
+        if s >= 0:
+            # floor((u - half) * m / 2**frac) == floor(u * m / 2**frac) - offset
+            wide = ((product >> frac) & (wide_ones * mask)) + wide_ones * (
+                fixed._mask + 1 - offset
+            )
+        else:
+            # floor((half - u) * m / 2**frac) == offset - ceil(u * m / 2**frac)
+            product += wide_ones * ((1 << frac) - 1)
+            wide = wide_ones * (offset + fixed._mask + 1) - (
+                (product >> frac) & (wide_ones * mask)
+            )
+        return _narrow_lanes(wide, self.raw.typecode, count, size)
+
+    def __truediv__(self, other):
+        # Inlined _fixed_div: truncate toward zero, flooring on magnitudes.
+        frac = self._fixed._frac
+        o = self._other_raw(other)
+        if o is None:
+            b = self._fixed(other).raw
+            quotients = [
+                (a << frac) // b if (a ^ b) >= 0 else -((-a << frac) // b)
+                for a in self.raw
+            ]
+        else:
+            quotients = [
+                (a << frac) // b if (a ^ b) >= 0 else -((-a << frac) // b)
+                for a, b in zip(self.raw, o)
+            ]
+        return self._wrap(self._fixed, self._wrap_wide(quotients))
+
+    def __len__(self):
+        return len(self.raw)
+
+    def __getitem__(self, index: int):
+        return self._fixed.FromRaw(self.raw[index])
+
+    def __setitem__(self, index: int, value):
+        self.raw[index] = self._fixed(value).raw
+
+    def __iter__(self):
+        FromRaw = self._fixed.FromRaw
+        return (FromRaw(r) for r in self.raw)
+
+    def ToList(self):
+        one = self._fixed._one
+        return [r / one for r in self.raw]
 
 NaN = None
 
@@ -572,3 +1370,21 @@ if __name__ == "__main__":
         print(f"\t{v2} * {i}: {v2 * i}")
         print(f"\t{v2} / {i}: {v2 / i}")
     print(f"{Vector2.Abs(Vector2(-1.0,-1.0))}")
+
+    # Zero-allocation hot loop once the pool is warm
+    pos, vel = Vector2(0.0, 0.0), Vector2(1.5, -0.5)
+    with Vector2Pool() as pool:
+        pool.get()
+    with AllocationCounter() as allocs:
+        for _ in range(1000):
+            with Vector2Pool() as pool:
+                step = vel.mul_into(0.016, pool.get())
+                pos.iadd(step)
+    print(f"In-place loop: {pos}, allocations: {allocs.total}")
+
+    # Fixed-point arithmetic
+    f1 = Q16_16(3.5)
+    f2 = Q16_16(Single(1.25))
+    print("Q16.16:", f1 * f2, f1 / f2, (f1 - f2).ToDecimal())
+    print("FixedVector2:", FixedVector2(1.5, 2) * (2, Q16_16(0.5)))
+    print("FixedArray:", (FixedArray([1, 2, 3]) * 0.5).ToList())
@@ -1,4 +1,7 @@
+import copy
+import marshal
 import queue
+import struct
 from time import sleep
 from typing import List
 import threading
@@ -7,12 +10,6 @@ from zephyros1938.csharp import *
 
 pygame.init()
 
-_ACTIVE_WINDOW = None
-_GLOBAL_EVENT_LIST = []
-_BARRIER = threading.Barrier(4)
-_EVENT_THREAD_FINISH = threading.Event()
-_DRAW_MANAGER_THREAD_FINISH = threading.Event()
-_RENDER_THREAD_FINISH = threading.Event()
 
 
 class WindowArgs(metaclass=AutoCastMeta):
@@ -25,6 +22,7 @@ class WindowArgs(metaclass=AutoCastMeta):
         pygame_gl_args=pygame.OPENGL | pygame.DOUBLEBUF,
         framerate=SByte(-1),
         vsync=Boolean(1),
+        timestep=Single(0),
     ):
         if vsync != 0 and vsync != 1:
             raise ValueError(f"vsync window argument must be 0/1, got {vsync}")
@@ -35,35 +33,197 @@ class WindowArgs(metaclass=AutoCastMeta):
         self.pygame_gl_args = pygame_gl_args
         self.framerate = framerate
         self.vsync = vsync
+        # Fixed seconds per frame for delta; 0 measures the real frame time.
+        self.timestep = Single(timestep)
+
+
+class Camera(Object, metaclass=AutoCastMeta):
+    """
+    A view into world space. (x, y) is the world point shown at the centre of
+    the viewport the camera is attached to.
+    """
+
+    def __init__(self, x=Single(0), y=Single(0), zoom=Single(1)):
+        self.x = Single(x)
+        self.y = Single(y)
+        self.zoom = Single(zoom)
+
+    def ToScreen(self, x, y, size):
+        """
+        Project a world point into the pixel space of a viewport of the given
+        (width, height).
+        """
+        return (
+            (x - self.x) * self.zoom + size[0] / 2,
+            (y - self.y) * self.zoom + size[1] / 2,
+        )
+
+
+class Viewport(Object, metaclass=AutoCastMeta):
+    """
+    A rectangle of a Window's surface that renders the window's objects
+    through its own Camera.
+    """
+
+    def __init__(self, x, y, width, height, camera=None):
+        self.x = Int16(x)
+        self.y = Int16(y)
+        self.width = Int16(width)
+        self.height = Int16(height)
+        self.camera = camera if camera is not None else Camera()
+
+    @property
+    def rect(self) -> pygame.Rect:
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
+
+# --- Input Record / Replay ---
+
+_LOG_MAGIC = b"ZREC"
+_LOG_VERSION = 1
+_LOG_HEADER = struct.Struct("<4sH")
+_LOG_FRAME = struct.Struct("<fI")  # delta (Single), event count
+_LOG_EVENT = struct.Struct("<II")  # event type, payload length
+_LOG_VALUE_TYPES = (bool, int, float, str, bytes, type(None))
+
+
+def _loggable(value):
+    """
+    True if marshal can store value: a plain scalar, or a tuple of them.
+    """
+    if isinstance(value, tuple):
+        return all(_loggable(v) for v in value)
+    return isinstance(value, _LOG_VALUE_TYPES)
+
+
+class InputRecorder(Object):
+    """
+    Streams each frame's timestep and events into a compact binary log.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, "wb")
+        self._file.write(_LOG_HEADER.pack(_LOG_MAGIC, _LOG_VERSION))
+
+    def write_frame(self, delta, events):
+        out = [_LOG_FRAME.pack(delta, len(events))]
+        for event in events:
+            # Attributes that cannot be marshalled (e.g. window handles) are dropped.
+            payload = marshal.dumps(
+                {
+                    k: v
+                    for k, v in event.__dict__.items()
+                    if _loggable(v)
+                }
+            )
+            out.append(_LOG_EVENT.pack(event.type, len(payload)))
+            out.append(payload)
+        self._file.write(b"".join(out))
+        # Flush every frame so a crash or hang keeps the frames leading up to it.
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class InputReplay(Object):
+    """
+    Reads back a log written by InputRecorder, one frame at a time.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        magic, version = _LOG_HEADER.unpack(self._file.read(_LOG_HEADER.size))
+        if magic != _LOG_MAGIC:
+            raise ValueError(f"{path} is not an input log")
+        if version != _LOG_VERSION:
+            raise ValueError(f"Unsupported input log version {version}")
+
+    def read_frame(self):
+        """
+        Returns (delta, events) for the next frame, or None once the log is
+        exhausted. A frame cut short (e.g. by a crash while recording) also
+        ends the log.
+        """
+        header = self._file.read(_LOG_FRAME.size)
+        if len(header) < _LOG_FRAME.size:
+            return None
+        delta, count = _LOG_FRAME.unpack(header)
+        events = []
+        for _ in range(count):
+            event_header = self._file.read(_LOG_EVENT.size)
+            if len(event_header) < _LOG_EVENT.size:
+                return None
+            typ, length = _LOG_EVENT.unpack(event_header)
+            payload = self._file.read(length)
+            if len(payload) < length:
+                return None
+            try:
+                attrs = marshal.loads(payload)
+            except (EOFError, ValueError, TypeError):
+                return None
+            events.append(pygame.event.Event(typ, attrs))
+        return Single(delta), events
+
+    def close(self):
+        self._file.close()
 
 
 class Window(Object, metaclass=AutoCastMeta):
 
-    def __init__(self, windowargs=WindowArgs()):
-        self.windowargs = windowargs
-        self._surface = pygame.display.set_mode(
-            [self.windowargs.width, self.windowargs.height],
-            self.windowargs.pygame_gl_args,
+    def __init__(
+        self, windowargs=None, record=None, replay=None, headless=None
+    ):
+        if record is not None and replay is not None:
+            raise ValueError("A Window cannot record and replay at the same time")
+        # Each window owns its args, so resizing one never touches another.
+        self.windowargs = (
+            WindowArgs() if windowargs is None else copy.copy(windowargs)
         )
+        # Headless windows draw to an off-screen surface and are not throttled,
+        # so any number of them can share a process. pygame only has one
+        # display, so at most one window per process should be on-screen.
+        # Replays default to headless.
+        self.headless = Boolean(replay is not None if headless is None else headless)
+        if record is not None and self.headless:
+            # Headless windows never poll pygame's event queue, so the log
+            # would only ever hold empty frames.
+            raise ValueError("A headless Window has no input to record")
+        if self.headless:
+            self._surface = pygame.Surface(
+                [self.windowargs.width, self.windowargs.height]
+            )
+        else:
+            self._surface = pygame.display.set_mode(
+                [self.windowargs.width, self.windowargs.height],
+                self.windowargs.pygame_gl_args,
+            )
 
         self._clock = pygame.time.Clock()
         self._draw_list = []
         self._pending_draw_list = []
+        self._pending_events = []
+        self.events = []
+        self._frame_delta = Single(0)
+        self._recorder = InputRecorder(record) if record is not None else None
+        self._replay = InputReplay(replay) if replay is not None else None
+        self._default_viewport = Viewport(
+            0, 0, self.windowargs.width, self.windowargs.height
+        )
+        self.viewports = [self._default_viewport]
         self.running = Boolean(0)
+        self.threadpool = []
 
-        global _ACTIVE_WINDOW
-        _ACTIVE_WINDOW = self
+        # The barrier action runs exactly once per frame, while every thread
+        # of this window is parked on the barrier.
+        self._barrier = threading.Barrier(4, action=self._end_frame)
 
     def _get_width(self) -> Int16:
         return self.windowargs.width
 
     def _set_width(self, width: Int16):
         self.windowargs.width = width
-        self._surface = pygame.display.set_mode(
-            size=[self.windowargs.width, self.windowargs.height],
-            flags=self.windowargs.pygame_gl_args,
-            vsync=self.windowargs.vsync,
-        )
+        self._resize_surface()
 
     width = property(_get_width, _set_width)
 
@@ -72,30 +232,81 @@ class Window(Object, metaclass=AutoCastMeta):
 
     def _set_height(self, height: Int16):
         self.windowargs.height = height
-        self._surface = pygame.display.set_mode(
-            [self.windowargs.width, self.windowargs.height],
-            self.windowargs.pygame_gl_args,
-        )
+        self._resize_surface()
 
     height = property(_get_height, _set_height)
 
+    def _resize_surface(self):
+        size = [self.windowargs.width, self.windowargs.height]
+        if self.headless:
+            self._surface = pygame.Surface(size)
+        else:
+            self._surface = pygame.display.set_mode(
+                size=size,
+                flags=self.windowargs.pygame_gl_args,
+                vsync=self.windowargs.vsync,
+            )
+        # The default viewport tracks the window; others are clipped when drawn.
+        self._default_viewport.width = Int16(self.windowargs.width)
+        self._default_viewport.height = Int16(self.windowargs.height)
+
     @property
     def delta(self) -> Single:
-        return self._clock.get_time() / 1000.0
+        """
+        Timestep of the previous frame, latched at the frame boundary so every
+        thread sees the same value (and a replay sees the recorded one).
+        """
+        return self._frame_delta
+
+    def _end_frame(self):
+        if not self.running:
+            return
+        if self._replay is not None:
+            frame = self._replay.read_frame()
+            if frame is None:
+                self.running = Boolean(0)
+                return
+            self._frame_delta, self.events = frame
+            if any(event.type == pygame.QUIT for event in self.events):
+                self.running = Boolean(0)
+            return
+        if self.windowargs.timestep > 0:
+            self._frame_delta = self.windowargs.timestep
+        else:
+            self._frame_delta = Single(self._clock.get_time() / 1000.0)
+        self.events = self._pending_events
+        self._pending_events = []
+        if self._recorder is not None:
+            self._recorder.write_frame(self._frame_delta, self.events)
+        # Stop here rather than from the event thread, so every thread leaves
+        # its loop together and Run() can clean up (and close the recording).
+        if any(event.type == pygame.QUIT for event in self.events):
+            self.running = Boolean(0)
 
     def _RENDER_THREAD(self):
         while self.running:
-            self._clock.tick(self.windowargs.framerate)
+            if self.headless:
+                # Unthrottled, but still measured so delta advances.
+                self._clock.tick()
+            else:
+                self._clock.tick(self.windowargs.framerate)
             self._surface.fill(self.windowargs.background_color)
-            for item in self._draw_list:
-                item._draw()
-            pygame.display.flip()
+            bounds = self._surface.get_rect()
+            for viewport in self.viewports:
+                rect = viewport.rect.clip(bounds)
+                if rect.width == 0 or rect.height == 0:
+                    continue
+                target = self._surface.subsurface(rect)
+                for item in self._draw_list:
+                    item._draw(target, viewport.camera)
+            if not self.headless:
+                pygame.display.flip()
             print("RENDR TICK", self.delta)
             try:
-                _BARRIER.wait()
+                self._barrier.wait()
             except threading.BrokenBarrierError:
                 break
-        _BARRIER.wait()
+        self._barrier.wait()
 
     def _LOGIC_THREAD(self):
         while self.running:
@@ -106,23 +317,24 @@ class Window(Object, metaclass=AutoCastMeta):
                     item._update()
             print("LOGIC TICK", self.delta)
             try:
-                _BARRIER.wait()
+                self._barrier.wait()
             except threading.BrokenBarrierError:
                 break
-        _BARRIER.wait()
+        self._barrier.wait()
 
     def _EVENT_THREAD(self):
         while self.running:
-            global _GLOBAL_EVENT_LIST
-            _GLOBAL_EVENT_LIST = pygame.event.get()
-            if any(event.type == pygame.QUIT for event in _GLOBAL_EVENT_LIST):
-                self.Cleanup()
+            # Events are published to self.events at the frame boundary; during a
+            # replay they come from the log instead. Only the on-screen window
+            # owns the pygame event queue.
+            if self._replay is None and not self.headless:
+                self._pending_events = pygame.event.get()
             print("EVENT TICK", self.delta)
             try:
-                _BARRIER.wait()
+                self._barrier.wait()
             except threading.BrokenBarrierError:
                 break
-        _BARRIER.wait()
+        self._barrier.wait()
 
     def _DRAW_ADDITION_THREAD(self):
         while self.running:
@@ -131,10 +343,10 @@ class Window(Object, metaclass=AutoCastMeta):
                 self._pending_draw_list.remove(item)
             print("DRAWR TICK", self.delta)
             try:
-                _BARRIER.wait()
+                self._barrier.wait()
             except threading.BrokenBarrierError:
                 break
-        _BARRIER.wait()
+        self._barrier.wait()
 
     def Run(self):
         self.running = Boolean(1)
@@ -158,6 +370,12 @@ class Window(Object, metaclass=AutoCastMeta):
             print(f"{t.is_alive()}")
             t.join()
             print(f"{t.is_alive()}")
+        if self._recorder is not None:
+            self._recorder.close()
+            self._recorder = None
+        if self._replay is not None:
+            self._replay.close()
+            self._replay = None
 
 
 class GraphicalObject(Object, metaclass=AutoCastMeta):
@@ -167,12 +385,12 @@ class GraphicalObject(Object, metaclass=AutoCastMeta):
         self._vel_y = Single(0.0)
         self.destroyed = Boolean(False)
 
-    def _draw(self):
+    def _draw(self, surface, camera):
         raise NotImplementedError(
             "All GraphicalObjects must have a way of drawing themselves"
         )
 
-    def _update():
+    def _update(self):
         pass
 
     def _get_vel_x(self) -> Single:
@@ -210,9 +428,139 @@ class GraphicalObject(Object, metaclass=AutoCastMeta):
         self.destroyed = Boolean(True)
 
 
+# --- Level of Detail ---
+
+# Largest on-screen error, in pixels, a simplified LOD level may introduce.
+LOD_PIXEL_ERROR = 0.5
+
+
+def _segment_distance_sq(p, a, b):
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    length_sq = dx * dx + dy * dy
+    if length_sq == 0:
+        return (p[0] - a[0]) ** 2 + (p[1] - a[1]) ** 2
+    t = max(0.0, min(1.0, ((p[0] - a[0]) * dx + (p[1] - a[1]) * dy) / length_sq))
+    px, py = a[0] + t * dx, a[1] + t * dy
+    return (p[0] - px) ** 2 + (p[1] - py) ** 2
+
+
+def _douglas_peucker(points, tolerance):
+    """
+    Simplify an open polyline, keeping both endpoints.
+    """
+    tolerance_sq = tolerance * tolerance
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        start, end = stack.pop()
+        worst, worst_index = tolerance_sq, -1
+        for i in range(start + 1, end):
+            d = _segment_distance_sq(points[i], points[start], points[end])
+            if d > worst:
+                worst, worst_index = d, i
+        if worst_index != -1:
+            keep[worst_index] = True
+            stack.append((start, worst_index))
+            stack.append((worst_index, end))
+    return [p for p, k in zip(points, keep) if k]
+
+
+def _simplify_polygon(points, tolerance):
+    """
+    Douglas-Peucker for a closed ring: split at the vertex farthest from the
+    first one and simplify both halves.
+    """
+    if len(points) <= 3:
+        return list(points)
+    x0, y0 = points[0]
+    far = max(
+        range(len(points)),
+        key=lambda i: (points[i][0] - x0) ** 2 + (points[i][1] - y0) ** 2,
+    )
+    first = _douglas_peucker(points[: far + 1], tolerance)
+    second = _douglas_peucker(points[far:] + [points[0]], tolerance)
+    return first[:-1] + second[:-1]
+
+
 class PolygonalObject(GraphicalObject, metaclass=AutoCastMeta):
+    """
+    A filled polygon whose points are relative to (x, y). Simplified vertex
+    sets are precomputed whenever the points change, and each frame the
+    coarsest one whose error stays under LOD_PIXEL_ERROR at the camera's zoom
+    is drawn.
+    """
 
-    def __init__(self, x, y, points: List[Vector2]):
+    def __init__(
+        self,
+        x,
+        y,
+        points: List[Vector2],
+        color=(Byte(0), Byte(0), Byte(0)),
+    ):
         super().__init__()
         self.x = x
         self.y = y
+        self.color = color
+        self.points = points
+
+    def _get_points(self):
+        return self._points
+
+    def _set_points(self, points):
+        self._points = [(float(p[0]), float(p[1])) for p in points]
+        self._build_lod()
+
+    points = property(_get_points, _set_points)
+
+    def _build_lod(self):
+        """
+        Cache (tolerance, points) levels, from the full outline (tolerance 0)
+        to the coarsest, with tolerance doubling per level.
+        """
+        points = self._points
+        self._lod_levels = [(0.0, points)]
+        if len(points) <= 3:
+            return
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        extent = max(max(xs) - min(xs), max(ys) - min(ys))
+        tolerance = extent / 4096
+        while tolerance > 0 and tolerance < extent:
+            previous = self._lod_levels[-1][1]
+            if len(previous) <= 3:
+                break
+            simplified = _simplify_polygon(points, tolerance)
+            if len(simplified) < 3:
+                break
+            if len(simplified) < len(previous):
+                self._lod_levels.append((tolerance, simplified))
+            tolerance *= 2
+
+    def LevelOfDetail(self, zoom) -> List[tuple]:
+        """
+        Returns the coarsest cached vertex set that stays within
+        LOD_PIXEL_ERROR pixels of the full outline at the given zoom.
+        """
+        if zoom <= 0:
+            return self._lod_levels[-1][1]
+        max_tolerance = LOD_PIXEL_ERROR / zoom
+        for tolerance, points in reversed(self._lod_levels):
+            if tolerance <= max_tolerance:
+                return points
+        return self._points
+
+    def _draw(self, surface, camera):
+        if not self.visible:
+            return
+        zoom = camera.zoom
+        points = self.LevelOfDetail(zoom)
+        # pygame.draw.polygon needs at least three points.
+        if len(points) < 3:
+            return
+        ox, oy = camera.ToScreen(self.x, self.y, surface.get_size())
+        pygame.draw.polygon(
+            surface,
+            self.color,
+            [(ox + px * zoom, oy + py * zoom) for px, py in points],
+        )